@@ -2,33 +2,33 @@
 API Routes - 이미지 분석 엔드포인트
 """
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Request, UploadFile, File, HTTPException, BackgroundTasks, Query
 from fastapi.responses import JSONResponse
 from typing import List, Optional
 import uuid
+import asyncio
 from datetime import datetime
 
-from app.services.hash_service import HashService
-from app.services.metadata_service import MetadataService
-from app.services.detection_service import DetectionService
 from app.services.pipeline_service import PipelineService
 from app.models.schemas import (
     AnalysisResult,
     BatchAnalysisResult,
+    VerdictType,
 )
 
 router = APIRouter()
 
-# 서비스 인스턴스
-hash_service = HashService()
-metadata_service = MetadataService()
-detection_service = DetectionService()
-pipeline_service = PipelineService()
+
+def get_pipeline_service(request: Request) -> PipelineService:
+    """앱 시작 시 생성된 PipelineService 인스턴스 반환"""
+    return request.app.state.pipeline_service
 
 
 @router.post("/analyze", response_model=AnalysisResult)
 async def analyze_single_image(
-    file: UploadFile = File(...)
+    request: Request,
+    file: UploadFile = File(...),
+    skip_ai_detection: bool = Query(False, description="Layer 3(AI 탐지 모델) 생략")
 ):
     """
     단일 이미지 분석
@@ -38,11 +38,13 @@ async def analyze_single_image(
     if not file.content_type or not file.content_type.startswith("image/"):
         raise HTTPException(status_code=400, detail="이미지 파일만 업로드 가능합니다.")
     
+    pipeline_service = get_pipeline_service(request)
     try:
         contents = await file.read()
         result = await pipeline_service.analyze_image(
             image_bytes=contents,
-            filename=file.filename
+            filename=file.filename,
+            skip_ai_detection=skip_ai_detection
         )
         return result
     except Exception as e:
@@ -51,7 +53,9 @@ async def analyze_single_image(
 
 @router.post("/analyze/batch", response_model=BatchAnalysisResult)
 async def analyze_batch_images(
+    request: Request,
     files: List[UploadFile] = File(...),
+    skip_ai_detection: bool = Query(False, description="Layer 3(AI 탐지 모델) 생략"),
 ):
     """
     배치 이미지 분석 (최대 50개)
@@ -59,27 +63,27 @@ async def analyze_batch_images(
     if len(files) > 50:
         raise HTTPException(status_code=400, detail="최대 50개 파일까지 업로드 가능합니다.")
     
-    results = []
-    for file in files:
-        if file.content_type and file.content_type.startswith("image/"):
-            try:
-                contents = await file.read()
-                result = await pipeline_service.analyze_image(
-                    image_bytes=contents,
-                    filename=file.filename
-                )
-                results.append(result)
-            except Exception as e:
-                results.append({
-                    "filename": file.filename,
-                    "error": str(e),
-                    "status": "failed"
-                })
+    # 파일을 동시에 모두 읽은 뒤 배치 추론으로 한 번에 분석
+    valid_files = [f for f in files if f.content_type and f.content_type.startswith("image/")]
+    images_bytes = await asyncio.gather(*(f.read() for f in valid_files))
+
+    pipeline_service = get_pipeline_service(request)
+    results = await pipeline_service.analyze_images_batch(
+        list(images_bytes),
+        [f.filename for f in valid_files],
+        skip_ai_detection=skip_ai_detection
+    )
     
     # 통계 계산
     total = len(results)
-    ai_detected = sum(1 for r in results if isinstance(r, dict) and r.get("final_verdict") == "ai_generated")
-    real_detected = sum(1 for r in results if isinstance(r, dict) and r.get("final_verdict") == "likely_real")
+    ai_detected = sum(
+        1 for r in results
+        if isinstance(r, AnalysisResult) and r.final_verdict == VerdictType.AI_GENERATED
+    )
+    real_detected = sum(
+        1 for r in results
+        if isinstance(r, AnalysisResult) and r.final_verdict == VerdictType.LIKELY_REAL
+    )
     
     return BatchAnalysisResult(
         total_processed=total,
@@ -3,21 +3,65 @@ AI Image Filter Pipeline - FastAPI Backend
 ML 학습 데이터셋에서 AI 생성 이미지를 필터링하는 파이프라인
 """
 
+import os
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 
-from app.api import routes
+# orjson은 선택적 import (설치되어 있으면 응답 직렬화에 사용)
+try:
+    from fastapi.responses import ORJSONResponse
+    import orjson  # noqa: F401  (ORJSONResponse는 직렬화 시점에야 orjson을 import하므로 여기서 확인)
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
+from app.api import routes
+from app.services.hash_service import HashService
+from app.services.metadata_service import MetadataService, warmup_worker
+from app.services.detection_service import get_detector
+from app.services.pipeline_service import PipelineService
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """앱 시작/종료 시 실행되는 로직"""
-    # Startup
+    # Startup: GIL에 묶이는 순수 Python 작업(EXIF/C2PA 파싱)용 프로세스 풀
+    # 모델/CUDA 초기화 이후 fork되지 않도록 spawn 사용
+    cpu_pool_workers = int(os.getenv("CPU_POOL_WORKERS", os.cpu_count() or 1))
+    app.state.cpu_pool = ProcessPoolExecutor(
+        max_workers=cpu_pool_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=warmup_worker
+    )
+
+    # 모델을 포함한 서비스는 프로세스당 한 번만 생성
+    app.state.hash_service = HashService()
+    app.state.metadata_service = MetadataService()
+    app.state.detection_service = get_detector()
+    app.state.pipeline_service = PipelineService(
+        hash_service=app.state.hash_service,
+        metadata_service=app.state.metadata_service,
+        detection_service=app.state.detection_service,
+        cpu_executor=app.state.cpu_pool,
+    )
+
+    # 첫 요청이 모델 로딩/초기화 비용을 내지 않도록 미리 추론 한 번 실행
+    loop = asyncio.get_running_loop()
+    # spawn 워커는 작업이 들어올 때 생성되므로 워커 수만큼 빈 작업을 넣어 모두 미리 시작
+    await asyncio.gather(
+        loop.run_in_executor(None, app.state.hash_service.warmup),
+        *(loop.run_in_executor(app.state.cpu_pool, warmup_worker) for _ in range(cpu_pool_workers)),
+    )
+    await app.state.detection_service.warmup()
     print("✅ Service initialized (Stateless)")
     yield
     # Shutdown
+    app.state.cpu_pool.shutdown(wait=False, cancel_futures=True)
     print("👋 Shutting down...")
 
 
@@ -29,14 +73,15 @@ app = FastAPI(
     AI 생성 이미지를 탐지하여 학습 데이터셋의 품질을 보장합니다.
     
     ### 3-Layer 검증 시스템
-    - **Layer 1**: Hash Check - 이미지 해시 계산 (MD5, SHA256, Perceptual Hash)
+    - **Layer 1**: Hash Check - DinoV2 벡터 유사도 기반 AI 이미지 DB 매칭
     - **Layer 2**: Metadata Analysis - C2PA/EXIF 분석 및 AI 도구 시그니처 탐지
     - **Layer 3**: AI Detection - ML 모델 기반 AI 생성 이미지 탐지
     
     *Stateless 서비스 - 데이터베이스 미사용*
     """,
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
 )
 
 # CORS 설정
@@ -0,0 +1,112 @@
+"""
+Async Batcher
+동시에 들어온 단일 이미지 요청을 모아 한 번의 모델 forward로 처리
+"""
+
+import os
+import asyncio
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+# 배치 크기 / 대기 시간은 환경변수로 조정
+DEFAULT_MAX_BATCH_SIZE = int(os.getenv("BATCH_MAX_SIZE", "32"))
+DEFAULT_MAX_WAIT_MS = float(os.getenv("BATCH_MAX_WAIT_MS", "10"))
+
+
+class AsyncBatcher:
+    """
+    동적 배칭 요청 수집기
+
+    submit()으로 들어온 요청을 최대 max_wait_ms 동안 (또는 max_batch_size개가 찰 때까지)
+    모아서 process_batch를 한 번 호출하고, 결과를 요청별 Future로 돌려줍니다.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], Sequence[Any]],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+    ):
+        """
+        AsyncBatcher 초기화
+
+        Args:
+            process_batch: 입력 리스트를 받아 같은 순서의 결과를 반환하는 동기 함수
+                (스레드 풀에서 실행됨)
+            max_batch_size: 한 번에 처리할 최대 요청 수
+            max_wait_ms: 첫 요청 이후 다음 요청을 기다리는 최대 시간
+        """
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, item: Any) -> Any:
+        """요청 하나를 배치 큐에 넣고 결과를 기다림"""
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    def _ensure_worker(self) -> None:
+        """현재 이벤트 루프에서 백그라운드 워커가 돌고 있지 않으면 시작"""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def _collect(self) -> List[Tuple[Any, asyncio.Future]]:
+        """첫 요청을 기다린 뒤 max_wait_ms 동안 추가 요청 수집"""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait_ms / 1000
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        # 이미 취소된 요청은 처리하지 않음
+        return [(item, future) for item, future in batch if not future.done()]
+
+    async def _run(self) -> None:
+        """배치 수집 → 처리 → 결과 분배 반복"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            if not batch:
+                continue
+
+            items = [item for item, _ in batch]
+            try:
+                outputs = await loop.run_in_executor(None, self.process_batch, items)
+            except Exception as e:
+                if len(batch) == 1:
+                    if not batch[0][1].done():
+                        batch[0][1].set_exception(e)
+                else:
+                    # 입력 하나 때문에 같은 배치의 다른 요청까지 실패하지 않도록 한 건씩 다시 처리
+                    await self._run_individually(batch)
+                continue
+
+            for (_, future), output in zip(batch, outputs):
+                if not future.done():
+                    future.set_result(output)
+
+    async def _run_individually(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """배치 처리 실패 시 요청별로 처리하여 실제로 실패한 요청에만 예외 전달"""
+        loop = asyncio.get_running_loop()
+        for item, future in batch:
+            if future.done():
+                continue
+            try:
+                outputs = await loop.run_in_executor(None, self.process_batch, [item])
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(outputs[0])
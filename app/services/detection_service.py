@@ -4,11 +4,23 @@ HuggingFace 모델 기반 AI 이미지 탐지
 """
 
 import io
+import os
 import asyncio
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 from PIL import Image
 import torch
-from transformers import pipeline
+from transformers import AutoImageProcessor, AutoModelForImageClassification
+
+# bitsandbytes는 선택적 import (GPU INT8 양자화용)
+try:
+    from transformers import BitsAndBytesConfig
+    import bitsandbytes  # noqa: F401
+    BNB_AVAILABLE = True
+except ImportError:
+    BNB_AVAILABLE = False
+
+from app.services.batcher import AsyncBatcher, DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT_MS
 
 
 class DetectionService:
@@ -28,43 +40,112 @@ class DetectionService:
     
     DEFAULT_MODEL = "Ateeqq/ai-vs-human-image-detector"
     
-    def __init__(self, model_name: str = None):
+    # INT8 양자화 사용 여부 (환경변수 DETECTION_QUANTIZE=1)
+    QUANTIZE = os.getenv("DETECTION_QUANTIZE", "0") == "1"
+    
+    def __init__(
+        self,
+        model_name: str = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        quantize: Optional[bool] = None
+    ):
         self.model_name = model_name or self.DEFAULT_MODEL
-        self._classifier = None
+        self.quantize = self.QUANTIZE if quantize is None else quantize
+        self._model = None
+        self._processor = None
         self._model_loaded = False
+        
+        # GPU 사용 가능 시 GPU에서 FP16으로 추론
+        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        self.dtype = torch.float16 if self.device.type == "cuda" else torch.float32
+        
+        # 동시에 들어온 단일 이미지 요청을 한 번의 forward로 처리
+        self.batcher = AsyncBatcher(
+            self._classify_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms
+        )
     
     @property
-    def classifier(self):
-        """Lazy loading of the classifier"""
-        if self._classifier is None:
+    def model(self):
+        """Lazy loading of the classifier model"""
+        if self._model is None:
             self._load_model()
-        return self._classifier
+        return self._model
     
     def _load_model(self):
         """모델 로드 (최초 호출 시)"""
         try:
             print(f"🔄 Loading model: {self.model_name}")
             
-            # GPU 사용 가능 여부 확인
-            device = 0 if torch.cuda.is_available() else -1
-            
-            self._classifier = pipeline(
-                "image-classification",
-                model=self.model_name,
-                device=device
-            )
+            self._processor = AutoImageProcessor.from_pretrained(self.model_name)
+            if self.quantize:
+                self._model = self._load_quantized_model()
+            else:
+                self._model = AutoModelForImageClassification.from_pretrained(
+                    self.model_name,
+                    torch_dtype=self.dtype
+                ).to(self.device).eval()
             
             self._model_loaded = True
-            print(f"✅ Model loaded successfully on {'GPU' if device == 0 else 'CPU'}")
+            print(f"✅ Model loaded successfully on {'GPU' if self.device.type == 'cuda' else 'CPU'}")
             
         except Exception as e:
             print(f"❌ Failed to load model: {e}")
             raise RuntimeError(f"Model loading failed: {e}")
     
-    async def detect(self, image_bytes: bytes) -> Dict[str, Any]:
+    def _load_quantized_model(self):
+        """
+        INT8 양자화 모델 로드
+        
+        - GPU: bitsandbytes LLM.int8 (설치된 경우)
+        - CPU: PyTorch dynamic quantization (Linear 레이어, VNNI 지원 CPU에서 INT8 연산)
+        """
+        if self.device.type == "cuda" and BNB_AVAILABLE:
+            print("🔄 Quantizing model to INT8 (bitsandbytes)")
+            return AutoModelForImageClassification.from_pretrained(
+                self.model_name,
+                quantization_config=BitsAndBytesConfig(load_in_8bit=True),
+                torch_dtype=self.dtype,
+                device_map="auto"
+            ).eval()
+        
+        model = AutoModelForImageClassification.from_pretrained(
+            self.model_name,
+            torch_dtype=self.dtype
+        ).eval()
+        if self.device.type == "cuda":
+            print("⚠️ bitsandbytes not installed, using FP16 model")
+            return model.to(self.device)
+        
+        print("🔄 Quantizing model to INT8 (dynamic quantization)")
+        return torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    
+    async def warmup(self) -> None:
+        """
+        모델 로드 후 더미 이미지로 추론을 한 번 실행하여 첫 요청의 cold start 제거
+
+        detect()와 달리 예외를 삼키지 않으므로 모델이 동작하지 않으면 앱 시작이 실패합니다.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._warmup_sync)
+    
+    def _warmup_sync(self) -> None:
+        """lazy 로딩된 모델로 더미 이미지 한 장 분류"""
+        _ = self.model
+        self._classify_batch([Image.new("RGB", (224, 224))])
+    
+    async def detect(self, image_bytes: bytes, image: Optional[Image.Image] = None) -> Dict[str, Any]:
         """
         이미지의 AI 생성 여부 탐지
         
+        Args:
+            image_bytes: 이미지 바이트 데이터
+            image: 이미 디코딩된 RGB 이미지 (없으면 image_bytes에서 로드)
+        
         Returns:
             - is_ai_generated: AI 생성 여부
             - confidence: 확신도 (0.0 ~ 1.0)
@@ -72,26 +153,77 @@ class DetectionService:
         """
         try:
             # 이미지 로드
-            img = Image.open(io.BytesIO(image_bytes)).convert("RGB")
+            img = image if image is not None else Image.open(io.BytesIO(image_bytes)).convert("RGB")
             
-            # 추론 실행 (비동기로 실행)
-            loop = asyncio.get_event_loop()
-            results = await loop.run_in_executor(
-                None, 
-                lambda: self.classifier(img)
-            )
+            # 추론 실행 (다른 동시 요청과 배치로 실행)
+            results = await self.batcher.submit(img)
             
             # 결과 파싱
             return self._parse_results(results)
             
         except Exception as e:
-            return {
-                "model_name": self.model_name,
-                "is_ai_generated": False,
-                "confidence": 0.0,
-                "error": str(e),
-                "raw_scores": None
-            }
+            return self._error_result(e)
+    
+    async def detect_batch(self, images: List[Image.Image]) -> List[Dict[str, Any]]:
+        """
+        여러 이미지의 AI 생성 여부를 max_batch_size 단위 forward로 탐지
+        
+        Args:
+            images: 디코딩된 RGB 이미지 리스트
+        
+        Returns:
+            입력 순서와 같은 detect() 형식의 결과 리스트
+        """
+        if not images:
+            return []
+        
+        loop = asyncio.get_running_loop()
+        step = self.batcher.max_batch_size
+        parsed = []
+        for start in range(0, len(images), step):
+            chunk = images[start:start + step]
+            try:
+                batch_results = await loop.run_in_executor(None, self._classify_batch, chunk)
+                parsed.extend(self._parse_results(results) for results in batch_results)
+            except Exception as e:
+                # 실패한 청크만 에러 결과로 채우고 이미 성공한 청크 결과는 유지
+                parsed.extend(self._error_result(e) for _ in chunk)
+        return parsed
+    
+    def _classify_batch(self, images: List[Image.Image]) -> List[List[Dict[str, Any]]]:
+        """
+        이미지 배치 분류 (전처리 → forward → softmax)
+        
+        Returns:
+            이미지별 [{"label": ..., "score": ...}] 리스트
+        """
+        model = self.model
+        inputs = self._processor(images=images, return_tensors="pt")
+        pixel_values = inputs["pixel_values"]
+        if self.device.type == "cuda":
+            # pinned 메모리에서 비동기로 GPU에 복사
+            pixel_values = pixel_values.pin_memory()
+        pixel_values = pixel_values.to(self.device, dtype=self.dtype, non_blocking=True)
+        
+        with torch.inference_mode():
+            logits = model(pixel_values).logits
+            probs = logits.float().softmax(dim=-1).cpu().tolist()
+        
+        id2label = model.config.id2label
+        return [
+            [{"label": id2label[i], "score": score} for i, score in enumerate(row)]
+            for row in probs
+        ]
+    
+    def _error_result(self, error: Exception) -> Dict[str, Any]:
+        """탐지 실패 결과"""
+        return {
+            "model_name": self.model_name,
+            "is_ai_generated": False,
+            "confidence": 0.0,
+            "error": str(error),
+            "raw_scores": None
+        }
     
     def _parse_results(self, results: list) -> Dict[str, Any]:
         """모델 결과 파싱"""
@@ -127,6 +259,13 @@ class DetectionService:
         return {
             "model_name": self.model_name,
             "model_loaded": self._model_loaded,
+            "quantized": self.quantize,
             "available_models": list(self.AVAILABLE_MODELS.keys()),
-            "device": "GPU" if torch.cuda.is_available() else "CPU"
+            "device": "GPU" if self.device.type == "cuda" else "CPU"
         }
+
+
+@lru_cache(maxsize=len(DetectionService.AVAILABLE_MODELS))
+def get_detector(model_name: str = DetectionService.DEFAULT_MODEL) -> DetectionService:
+    """모델별 DetectionService 인스턴스를 프로세스 전체에서 하나만 생성"""
+    return DetectionService(model_name)
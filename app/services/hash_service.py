@@ -4,19 +4,146 @@ Layer 1: Hash Service
 """
 
 import io
-from typing import Dict, Optional, Tuple
+import os
+import csv
+import glob
+import asyncio
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from PIL import Image
 import numpy as np
-import pandas as pd
 import torch
 from transformers import AutoImageProcessor, AutoModel
 
+from app.services.batcher import AsyncBatcher, DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT_MS
+from app.services.lru_cache import LRUCache
+
+# FAISS는 선택적 import (설치 안 되어 있으면 NumPy 행렬곱으로 검색)
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+# Numba는 선택적 import (FAISS가 없을 때 JIT 컴파일된 검색 커널 사용)
+try:
+    import numba
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# BLAKE3는 선택적 import (설치 안 되어 있으면 SHA256으로 캐시 키 계산)
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+
+# 큰 이미지는 블록 단위로 나누어 병렬 해싱 (hashlib은 해싱 중 GIL을 해제)
+DIGEST_PARALLEL_THRESHOLD = 4 * 1024 * 1024
+DIGEST_BLOCK_SIZE = 256 * 1024
+_digest_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+
+# DB 벡터 정규화 / 검색 시 한 번에 float32로 올리는 행 수
+DB_BLOCK_ROWS = 8192
+
+
+if NUMBA_AVAILABLE:
+    # float16 비트 패턴 → float32 변환 테이블 (Numba는 float16 연산 미지원)
+    _FP16_LUT = np.arange(65536, dtype=np.uint16).view(np.float16).astype(np.float32)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _max_cosine_fp16(db_bits, lut, queries, n_chunks):
+        """
+        float16 DB(uint16 비트 뷰)에서 쿼리별 최대 내적과 인덱스를 한 번의 순회로 계산
+
+        (N,) 크기의 중간 유사도 배열 없이 행 구간별 최대값만 유지한 뒤 합칩니다.
+        """
+        n, d = db_bits.shape
+        b = queries.shape[0]
+        chunk = (n + n_chunks - 1) // n_chunks
+        chunk_sims = np.full((n_chunks, b), -np.inf, dtype=np.float32)
+        chunk_indices = np.zeros((n_chunks, b), dtype=np.int64)
+
+        for c in prange(n_chunks):
+            for i in range(c * chunk, min((c + 1) * chunk, n)):
+                for k in range(b):
+                    s = np.float32(0.0)
+                    for j in range(d):
+                        s += lut[db_bits[i, j]] * queries[k, j]
+                    if s > chunk_sims[c, k]:
+                        chunk_sims[c, k] = s
+                        chunk_indices[c, k] = i
+
+        max_indices = np.zeros(b, dtype=np.int64)
+        max_sims = np.full(b, -np.inf, dtype=np.float32)
+        for c in range(n_chunks):
+            for k in range(b):
+                if chunk_sims[c, k] > max_sims[k]:
+                    max_sims[k] = chunk_sims[c, k]
+                    max_indices[k] = chunk_indices[c, k]
+        return max_indices, max_sims
+
+
+def _sha256(data) -> bytes:
+    return hashlib.sha256(data, usedforsecurity=False).digest()
+
+
+def content_digest(image_bytes: bytes) -> str:
+    """
+    이미지 바이트의 콘텐츠 다이제스트 (캐시 키로 사용)
+
+    blake3가 설치되어 있으면 BLAKE3(SIMD, 큰 입력은 멀티스레드)를 사용합니다.
+    없으면 보안 용도가 아니므로 usedforsecurity=False로 OpenSSL SHA256을 사용하고,
+    4MB를 넘는 이미지는 256KB 블록의 SHA256을 병렬로 계산한 뒤
+    블록 다이제스트들을 다시 해싱합니다 (hash of hashes).
+    """
+    if BLAKE3_AVAILABLE:
+        max_threads = blake3.blake3.AUTO if len(image_bytes) > DIGEST_PARALLEL_THRESHOLD else 1
+        return blake3.blake3(image_bytes, max_threads=max_threads).hexdigest()
+
+    if len(image_bytes) <= DIGEST_PARALLEL_THRESHOLD:
+        return hashlib.sha256(image_bytes, usedforsecurity=False).hexdigest()
+
+    view = memoryview(image_bytes)
+    blocks = [view[i:i + DIGEST_BLOCK_SIZE] for i in range(0, len(view), DIGEST_BLOCK_SIZE)]
+    block_digests = _digest_pool.map(_sha256, blocks)
+    return hashlib.sha256(b"".join(block_digests), usedforsecurity=False).hexdigest()
+
+
+class DinoV2CLS(torch.nn.Module):
+    """
+    DinoV2에서 CLS 토큰 특징만 반환하는 래퍼
+
+    HF 모델은 전체 토큰에 layernorm을 적용한 last_hidden_state와 pooler 출력을
+    모두 만들지만, 유사도 검색에는 CLS 토큰만 필요하므로 CLS만 정규화하여 반환합니다.
+    """
+
+    def __init__(self, model: torch.nn.Module):
+        super().__init__()
+        self.embeddings = model.embeddings
+        self.encoder = model.encoder
+        self.layernorm = model.layernorm
+
+    def forward(self, pixel_values: torch.Tensor) -> torch.Tensor:
+        hidden_states = self.encoder(self.embeddings(pixel_values))[0]
+        return self.layernorm(hidden_states[:, 0])
+
+
 class HashService:
     """이미지 해시 계산 및 중복 검사 서비스"""
 
     def __init__(self, db_vectors_path: str = './data/ai_dinohashes.npy',
                  metadata_path: str = './data/ai_metadata.csv',
-                 threshold: float = 0.85):
+                 threshold: float = 0.85,
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+                 compile_model: bool = True,
+                 feature_cache_size: int = 8192):
         """
         HashService 
 
@@ -24,22 +151,130 @@ class HashService:
             db_vectors_path: AI 이미지 벡터 파일 경로
             metadata_path: AI 이미지 메타데이터 파일 경로
             threshold: 유사도 임계값 (0~1)
+            max_batch_size: DinoV2 배치 추론 시 한 번에 처리할 최대 이미지 수
+            max_wait_ms: 단일 요청을 배치로 모으기 위해 기다리는 최대 시간
+            compile_model: torch.compile로 DinoV2 forward 컴파일 여부
+            feature_cache_size: 콘텐츠 다이제스트별 DinoV2 특징 벡터 캐시 크기
         """
+        # GPU 사용 가능 시 GPU 사용 (GPU에서는 FP16으로 추론)
+        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        self.dtype = torch.float16 if self.device.type == "cuda" else torch.float32
+
         # DinoV2 모델 로드
         self.model_name = "facebook/dinov2-small"
         self.processor = AutoImageProcessor.from_pretrained(self.model_name)
-        self.model = AutoModel.from_pretrained(self.model_name)
+        self.model = DinoV2CLS(self._load_model())
         self.model.eval()
-
-        # GPU 사용 가능 시 GPU로 이동
-        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         self.model.to(self.device)
+        self.max_batch_size = max_batch_size
+
+        # GPU forward는 전용 스레드 하나에서만 실행
+        # (배처 워커와 compute_hash_batch가 동시에 호출해도 CUDA graph를 한 스레드에서 재생)
+        self._forward_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dinov2-forward")
+        # GPU에서 torch.compile 사용 시 재컴파일을 막기 위해 배치를 패딩할 고정 크기 목록
+        self.batch_buckets: Optional[List[int]] = None
+        if compile_model:
+            self.model = self._compile_model(self.model)
 
         # DB 벡터 및 메타데이터 로드
-        self.db_vectors = np.load(db_vectors_path)
-        self.metadata = pd.read_csv(metadata_path)
+        # 정규화된 float16 DB 파일을 memory-map으로 열어 필요한 페이지만 읽음
+        db_unit = self._load_db_unit(db_vectors_path)
+        self.index = self._build_index(db_unit)
+        # FAISS 인덱스가 있으면 검색에 쓰지 않는 DB 행렬은 보관하지 않음
+        self.db_unit = db_unit if self.index is None else None
+        self.search_backend = self._select_search_backend()
+        # Numba 병렬 커널은 여러 스레드에서 동시에 호출하면 스레딩 레이어에 따라
+        # 프로세스가 중단되므로 (workqueue) 한 번에 하나씩만 실행 (커널 자체가 병렬)
+        self._numba_lock = threading.Lock()
+        self.metadata = self._load_metadata(metadata_path)
         self.threshold = threshold
 
+        # 같은 이미지가 다시 들어오면 DinoV2 forward 생략
+        self.feature_cache = LRUCache(maxsize=feature_cache_size)
+
+        # 동시에 들어온 단일 이미지 요청을 한 번의 DinoV2 forward로 처리
+        self.batcher = AsyncBatcher(
+            self._extract_features_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms
+        )
+
+    def _load_model(self) -> torch.nn.Module:
+        """
+        DinoV2 모델 로드 (fused SDPA attention 사용)
+
+        SDPA를 지원하지 않는 transformers 버전에서는 eager attention으로 로드합니다.
+        """
+        try:
+            return AutoModel.from_pretrained(
+                self.model_name, attn_implementation="sdpa", torch_dtype=self.dtype
+            )
+        except (TypeError, ValueError, ImportError) as e:
+            print(f"⚠️ SDPA attention unavailable, using eager attention: {e}")
+            return AutoModel.from_pretrained(self.model_name, torch_dtype=self.dtype)
+
+    def _compile_model(self, model: torch.nn.Module) -> torch.nn.Module:
+        """
+        torch.compile로 DinoV2 forward 컴파일 후 워밍업
+
+        GPU에서는 전처리 결과가 항상 224x224로 고정되므로 정적 shape와 CUDA graph로
+        컴파일하고, 배치 크기는 2의 거듭제곱 버킷(최대 max_batch_size)으로 패딩하여
+        버킷별로 미리 컴파일합니다. CPU에서는 CUDA graph가 없어 패딩이 연산 낭비일 뿐이므로
+        버킷 없이 컴파일하고 배치 크기 1로만 워밍업합니다.
+        컴파일에 실패하면 eager 모델을 그대로 사용합니다.
+
+        Args:
+            model: eager 모드 DinoV2 모델
+
+        Returns:
+            컴파일된 모델 (실패 시 원본 모델)
+        """
+        is_cuda = self.device.type == "cuda"
+        try:
+            if is_cuda:
+                compiled = torch.compile(model, mode="reduce-overhead", dynamic=False)
+                buckets = self._make_batch_buckets(self.max_batch_size)
+            else:
+                compiled = torch.compile(model)
+                buckets = [1]
+
+            # 첫 요청에서 컴파일 비용을 내지 않도록 미리 실행
+            # (CUDA graph는 두 번째 실행에서 기록되므로 GPU에서는 두 번씩)
+            def warmup_buckets():
+                with torch.inference_mode(), torch.autocast(
+                    self.device.type, dtype=self.dtype, enabled=is_cuda
+                ):
+                    for batch_size in buckets:
+                        dummy = torch.zeros(batch_size, 3, 224, 224, device=self.device, dtype=self.dtype)
+                        for _ in range(2 if is_cuda else 1):
+                            compiled(dummy)
+
+            self._forward_executor.submit(warmup_buckets).result()
+            if is_cuda:
+                self.batch_buckets = buckets
+                print(f"✅ DinoV2 model compiled with torch.compile (batch buckets: {buckets})")
+            else:
+                print("✅ DinoV2 model compiled with torch.compile")
+            return compiled
+        except Exception as e:
+            print(f"⚠️ torch.compile unavailable, using eager model: {e}")
+            return model
+
+    @staticmethod
+    def _make_batch_buckets(max_batch_size: int) -> List[int]:
+        """1, 2, 4, ... max_batch_size 형태의 배치 크기 버킷"""
+        buckets = []
+        size = 1
+        while size < max_batch_size:
+            buckets.append(size)
+            size *= 2
+        buckets.append(max_batch_size)
+        return buckets
+
+    def warmup(self) -> None:
+        """더미 이미지로 전처리 + DinoV2 forward를 한 번 실행 (CUDA 커널/cuDNN 초기화)"""
+        self._extract_features(Image.new("RGB", (224, 224)))
+
     def _extract_features(self, image: Image.Image) -> np.ndarray:
         """
         DinoV2 모델을 사용하여 이미지에서 특징 벡터 추출
@@ -50,33 +285,170 @@ class HashService:
         Returns:
             특징 벡터 (numpy array)
         """
-        # 이미지 전처리
-        inputs = self.processor(images=image, return_tensors="pt")
-        inputs = {k: v.to(self.device) for k, v in inputs.items()}
+        return self._extract_features_batch([image])[0]
+
+    def _extract_features_batch(self, images: List[Image.Image]) -> np.ndarray:
+        """
+        여러 이미지를 한 번의 DinoV2 forward로 특징 벡터 추출
+
+        Args:
+            images: PIL Image 리스트
+
+        Returns:
+            특징 벡터 행렬 (B, D)
+        """
+        # 이미지 전처리 (호출한 스레드에서 실행)
+        inputs = self.processor(images=images, return_tensors="pt")
+        return self._forward_executor.submit(self._forward, inputs["pixel_values"]).result()
+
+    def _forward(self, pixel_values: torch.Tensor) -> np.ndarray:
+        """
+        DinoV2 forward (전용 스레드에서만 실행)
+
+        GPU에서 컴파일된 모델이면 배치를 버킷 크기로 패딩한 뒤 실제 이미지 수만큼 잘라 반환합니다.
+        """
+        batch_size = pixel_values.shape[0]
+        if self.batch_buckets:
+            bucket = next((b for b in self.batch_buckets if b >= batch_size), batch_size)
+            if bucket > batch_size:
+                padding = pixel_values.new_zeros((bucket - batch_size, *pixel_values.shape[1:]))
+                pixel_values = torch.cat([pixel_values, padding])
+
+        if self.device.type == "cuda":
+            # pinned 메모리에서 비동기로 GPU에 복사
+            pixel_values = pixel_values.pin_memory()
+        pixel_values = pixel_values.to(self.device, dtype=self.dtype, non_blocking=True)
+
+        # 특징 추출 (inference mode + GPU에서는 autocast)
+        with torch.inference_mode(), torch.autocast(
+            self.device.type, dtype=self.dtype, enabled=self.device.type == "cuda"
+        ):
+            # CLS 토큰의 출력 사용 (유사도 계산은 float32로)
+            features = self.model(pixel_values).float().cpu().numpy()
+
+        return features[:batch_size]
+
+    @staticmethod
+    def _load_metadata(metadata_path: str) -> List[Dict[str, str]]:
+        """
+        AI 이미지 메타데이터 CSV 로드
+
+        find_similar_image()가 반환한 인덱스로 행을 바로 조회할 수 있도록
+        행별 dict 리스트로 저장합니다.
+        """
+        with open(metadata_path, newline='', encoding='utf-8') as f:
+            return list(csv.DictReader(f))
+
+    def _load_db_unit(self, db_vectors_path: str) -> np.ndarray:
+        """
+        L2 정규화된 float16 DB 벡터를 memory-map으로 로드
 
-        # 특징 추출 (no gradient 계산)
-        with torch.no_grad():
-            outputs = self.model(**inputs)
-            # CLS 토큰의 출력 사용
-            features = outputs.last_hidden_state[:, 0, :].cpu().numpy()
+        원본 옆에 정규화된 파일(*.unit_fp16.<크기>-<mtime>.npy)을 한 번 만들어 두고 이후에는 그대로
+        memory-map하므로, 여러 워커 프로세스가 프로세스별 복사본 없이 같은 페이지 캐시를 공유합니다.
+        파일 이름에 원본의 크기와 mtime을 넣어 원본이 바뀌면 (mtime이 과거로 바뀌어도) 다시 만들고,
+        shape가 원본과 다르면 다시 만듭니다. 파일을 쓸 수 없으면 메모리에서 정규화한 배열을 사용합니다.
 
-        return features.flatten()
+        Args:
+            db_vectors_path: 원본 DB 벡터 파일 경로 (float32/float16)
+
+        Returns:
+            L2 정규화된 DB 벡터 (float16, 가능하면 읽기 전용 memory-map)
+        """
+        db_vectors = np.load(db_vectors_path, mmap_mode='r')
+        source = os.stat(db_vectors_path)
+        unit_prefix = f"{os.path.splitext(db_vectors_path)[0]}.unit_fp16."
+        unit_path = f"{unit_prefix}{source.st_size}-{source.st_mtime_ns}.npy"
+
+        if os.path.exists(unit_path):
+            db_unit = np.load(unit_path, mmap_mode='r')
+            if db_unit.shape == db_vectors.shape:
+                return db_unit
+            print(f"⚠️ Normalized DB shape {db_unit.shape} != {db_vectors.shape}, rebuilding")
+
+        tmp_path = f"{unit_path}.{os.getpid()}.tmp"
+        try:
+            out = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.float16, shape=db_vectors.shape)
+            self._normalize_db(db_vectors, out)
+            out.flush()
+            del out
+            os.replace(tmp_path, unit_path)
+        except OSError as e:
+            print(f"⚠️ Could not write normalized DB ({e}), keeping it in memory")
+            return self._normalize_db(db_vectors)
+
+        # 이전 원본으로 만든 정규화 파일 정리
+        for stale_path in glob.glob(f"{glob.escape(unit_prefix)}*.npy"):
+            if stale_path != unit_path:
+                try:
+                    os.remove(stale_path)
+                except OSError:
+                    pass
+
+        print(f"✅ Normalized DB saved: {unit_path}")
+        return np.load(unit_path, mmap_mode='r')
+
+    @staticmethod
+    def _normalize_db(db_vectors: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        DB 벡터를 블록 단위로 L2 정규화하여 float16으로 저장
+
+        코사인 유사도는 FP16 정밀도에 충분히 강건하므로, 메모리와 검색 시
+        읽는 바이트 수를 절반으로 줄입니다.
 
-    def _compute_cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
+        Args:
+            db_vectors: 원본 DB 벡터 (N, D)
+            out: 결과를 쓸 float16 배열 (없으면 새로 할당)
+
+        Returns:
+            L2 정규화된 DB 벡터 (float16)
         """
-        두 벡터 간의 코사인 유사도 계산
+        db_unit = np.empty(db_vectors.shape, dtype=np.float16) if out is None else out
+        for start in range(0, len(db_vectors), DB_BLOCK_ROWS):
+            block = np.asarray(db_vectors[start:start + DB_BLOCK_ROWS], dtype=np.float32)
+            norms = np.linalg.norm(block, axis=1, keepdims=True)
+            db_unit[start:start + DB_BLOCK_ROWS] = block / norms
+        return db_unit
+
+    def _build_index(self, db_unit: np.ndarray):
+        """
+        정규화된 DB 벡터로 FAISS 내적(=코사인 유사도) 인덱스 생성
+
+        벡터는 FP16 scalar quantizer로 저장되어 검색 시 읽는 메모리가 절반입니다.
 
         Args:
-            vec1: 벡터 1
-            vec2: 벡터 2
+            db_unit: L2 정규화된 DB 벡터 (float16)
 
         Returns:
-            코사인 유사도 (0~1)
+            FAISS 인덱스. FAISS 미설치 시 None
+        """
+        if not FAISS_AVAILABLE:
+            return None
+
+        index = faiss.IndexScalarQuantizer(
+            db_unit.shape[1], faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_INNER_PRODUCT
+        )
+        for start in range(0, len(db_unit), DB_BLOCK_ROWS):
+            index.add(np.asarray(db_unit[start:start + DB_BLOCK_ROWS], dtype=np.float32))
+        return index
+
+    def _select_search_backend(self) -> str:
         """
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
-        return dot_product / (norm1 * norm2)
+        사용 가능한 검색 백엔드 선택 (FAISS > Numba > NumPy)
+
+        Numba 커널은 첫 요청에서 컴파일 비용을 내지 않도록 여기서 미리 실행합니다.
+        """
+        if self.index is not None:
+            return "faiss"
+
+        if NUMBA_AVAILABLE:
+            try:
+                dummy = np.zeros((1, self.db_unit.shape[1]), dtype=np.float32)
+                _max_cosine_fp16(self.db_unit.view(np.uint16), _FP16_LUT, dummy, numba.get_num_threads())
+                return "numba"
+            except Exception as e:
+                print(f"⚠️ Numba search kernel unavailable, using NumPy: {e}")
+
+        return "numpy"
 
     def find_similar_image(self, image_vector: np.ndarray) -> Tuple[Optional[int], float]:
         """
@@ -88,35 +460,97 @@ class HashService:
         Returns:
             (인덱스, 유사도) 튜플. 유사한 이미지가 없으면 (None, 0.0)
         """
-        max_similarity = 0.0
-        max_idx = None
+        return self.find_similar_images(image_vector[None, :])[0]
+
+    def find_similar_images(self, image_vectors: np.ndarray) -> List[Tuple[Optional[int], float]]:
+        """
+        여러 이미지 벡터에 대해 DB에서 가장 유사한 이미지를 한 번에 검색
+
+        Args:
+            image_vectors: 검색할 이미지 벡터 행렬 (B, D)
+
+        Returns:
+            이미지별 (인덱스, 유사도) 튜플 리스트
+        """
+        queries = image_vectors / np.linalg.norm(image_vectors, axis=1, keepdims=True)
+        queries = np.ascontiguousarray(queries, dtype=np.float32)
 
-        for idx, db_vector in enumerate(self.db_vectors):
-            similarity = self._compute_cosine_similarity(image_vector, db_vector)
-            if similarity > max_similarity:
-                max_similarity = similarity
-                max_idx = idx
+        if self.search_backend == "faiss":
+            # FAISS SIMD 커널로 최근접 벡터 검색
+            scores, indices = self.index.search(queries, 1)
+            max_indices = indices[:, 0]
+            max_similarities = scores[:, 0]
+        elif self.search_backend == "numba":
+            # JIT 컴파일된 병렬 커널로 유사도 계산과 최대값 탐색을 한 번에 수행
+            with self._numba_lock:
+                max_indices, max_similarities = _max_cosine_fp16(
+                    self.db_unit.view(np.uint16), _FP16_LUT, queries, numba.get_num_threads()
+                )
+        else:
+            max_indices, max_similarities = self._search_db_unit(queries)
 
-        if max_similarity >= self.threshold:
-            return max_idx, max_similarity
-        return None, max_similarity
+        results = []
+        for max_idx, max_similarity in zip(max_indices, max_similarities):
+            # FP16 반올림 오차로 1.0을 살짝 넘는 값 보정, 유사한 이미지가 없으면 (음수 포함) 0.0
+            max_similarity = min(max(float(max_similarity), 0.0), 1.0)
+            if max_similarity >= self.threshold:
+                results.append((int(max_idx), max_similarity))
+            else:
+                results.append((None, max_similarity))
+        return results
 
-    def compute_hash(self, image_bytes: bytes) -> Dict[str, any]:
+    def _search_db_unit(self, queries: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        정규화된 DB 행렬에서 쿼리별 최대 코사인 유사도 검색 (NumPy)
+
+        float16 DB를 블록 단위로 float32로 올려 행렬곱 (BLAS SGEMM) 후 최대값을 갱신합니다.
+
+        Args:
+            queries: L2 정규화된 쿼리 행렬 (B, D), float32
+
+        Returns:
+            (최대 유사도 인덱스, 최대 유사도) 배열 튜플
+        """
+        max_indices = np.zeros(len(queries), dtype=np.int64)
+        max_similarities = np.full(len(queries), -np.inf, dtype=np.float32)
+
+        for start in range(0, len(self.db_unit), DB_BLOCK_ROWS):
+            block = self.db_unit[start:start + DB_BLOCK_ROWS].astype(np.float32)
+            similarities = block @ queries.T
+            block_indices = similarities.argmax(axis=0)
+            block_max = similarities[block_indices, np.arange(len(queries))]
+
+            better = block_max > max_similarities
+            max_indices[better] = block_indices[better] + start
+            max_similarities[better] = block_max[better]
+
+        return max_indices, max_similarities
+
+    def compute_hash(self, image_bytes: bytes, image: Optional[Image.Image] = None,
+                     digest: Optional[str] = None) -> Dict[str, any]:
         """
         이미지의 dinohash 계산 및 AI 이미지 여부 판단
 
         Args:
             image_bytes: 이미지 바이트 데이터
+            image: 이미 디코딩된 RGB 이미지 (없으면 image_bytes에서 로드)
+            digest: image_bytes의 content_digest (없으면 직접 계산)
 
         Returns:
             - is_ai: AI 이미지 여부
             - similarity: 최대 유사도 점수
         """
-        # 이미지 로드
-        image = Image.open(io.BytesIO(image_bytes)).convert("RGB")
+        digest = digest or content_digest(image_bytes)
+        image_vector = self.feature_cache.get(digest)
+
+        if image_vector is None:
+            # 이미지 로드
+            if image is None:
+                image = Image.open(io.BytesIO(image_bytes)).convert("RGB")
 
-        # DinoV2로 특징 벡터 추출
-        image_vector = self._extract_features(image)
+            # DinoV2로 특징 벡터 추출
+            image_vector = self._extract_features(image)
+            self.feature_cache.put(digest, image_vector)
 
         # DB에서 유사한 이미지 찾기
         matched_idx, similarity = self.find_similar_image(image_vector)
@@ -127,4 +561,80 @@ class HashService:
         }
 
         return result
-    
\ No newline at end of file
+
+    async def compute_hash_async(self, image_bytes: bytes, image: Optional[Image.Image] = None,
+                                 digest: Optional[str] = None) -> Dict[str, any]:
+        """
+        compute_hash()의 비동기 버전
+
+        DinoV2 forward는 AsyncBatcher를 통해 다른 동시 요청과 함께 배치로 실행됩니다.
+
+        Args:
+            image_bytes: 이미지 바이트 데이터
+            image: 이미 디코딩된 RGB 이미지 (없으면 image_bytes에서 로드)
+            digest: image_bytes의 content_digest (없으면 직접 계산)
+
+        Returns:
+            compute_hash()와 같은 형식의 결과
+        """
+        loop = asyncio.get_running_loop()
+        digest = digest or content_digest(image_bytes)
+        image_vector = self.feature_cache.get(digest)
+
+        if image_vector is None:
+            if image is None:
+                image = await loop.run_in_executor(
+                    None, lambda: Image.open(io.BytesIO(image_bytes)).convert("RGB")
+                )
+            image_vector = await self.batcher.submit(image)
+            self.feature_cache.put(digest, image_vector)
+
+        # DB에서 유사한 이미지 찾기
+        matched_idx, similarity = await loop.run_in_executor(None, self.find_similar_image, image_vector)
+
+        return {
+            "is_ai": matched_idx is not None,
+            "similarity": float(similarity),
+        }
+
+    def compute_hash_batch(self, images: List[Image.Image],
+                           digests: Optional[List[str]] = None) -> List[Dict[str, any]]:
+        """
+        여러 이미지의 dinohash를 배치 추론으로 계산
+
+        캐시에 없는 이미지만 max_batch_size 단위로 묶어 DinoV2 forward를 실행합니다.
+
+        Args:
+            images: 디코딩된 RGB 이미지 리스트
+            digests: 이미지별 content_digest (없으면 특징 벡터 캐시 미사용)
+
+        Returns:
+            입력 순서와 같은 compute_hash() 형식의 결과 리스트
+        """
+        if not images:
+            return []
+
+        if digests is None:
+            image_vectors = [None] * len(images)
+        else:
+            image_vectors = [self.feature_cache.get(digest) for digest in digests]
+        missing = [i for i, vector in enumerate(image_vectors) if vector is None]
+
+        # DinoV2 배치 추론
+        for start in range(0, len(missing), self.max_batch_size):
+            chunk = missing[start:start + self.max_batch_size]
+            features = self._extract_features_batch([images[i] for i in chunk])
+            for i, vector in zip(chunk, features):
+                image_vectors[i] = vector
+                if digests is not None:
+                    self.feature_cache.put(digests[i], vector)
+
+        # DB 검색
+        results = []
+        for matched_idx, similarity in self.find_similar_images(np.stack(image_vectors)):
+            results.append({
+                "is_ai": matched_idx is not None,
+                "similarity": float(similarity),
+            })
+
+        return results
@@ -0,0 +1,44 @@
+"""
+LRU Cache
+이미지 콘텐츠 해시를 키로 사용하는 분석 결과 캐시
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    """스레드 안전한 고정 크기 LRU 캐시"""
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        LRUCache 초기화
+
+        Args:
+            maxsize: 최대 저장 항목 수 (0이면 캐시 비활성화)
+        """
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시 조회 (없으면 None). 조회된 항목은 가장 최근 항목으로 갱신"""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """캐시 저장. 최대 크기를 넘으면 가장 오래된 항목 제거"""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
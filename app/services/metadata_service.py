@@ -17,6 +17,16 @@ except ImportError:
     C2PA_AVAILABLE = False
 
 
+def warmup_worker() -> None:
+    """
+    프로세스 풀 워커 초기화
+
+    워커가 이 함수를 불러오면서 이 모듈(PIL, C2PA)을 import하고,
+    PIL 이미지 포맷 플러그인도 미리 로드하여 첫 분석 요청의 지연을 없앱니다.
+    """
+    Image.init()
+
+
 class MetadataService:
     """이미지 메타데이터 분석 서비스"""
     
@@ -53,9 +63,15 @@ class MetadataService:
         "diffusion model",
     ]
     
-    def analyze(self, image_bytes: bytes, filename: str) -> Dict[str, Any]:
+    def analyze(self, image_bytes: bytes, filename: str,
+                image: Optional[Image.Image] = None) -> Dict[str, Any]:
         """
         이미지 메타데이터 종합 분석
+
+        Args:
+            image_bytes: 이미지 바이트 데이터 (C2PA 분석용)
+            filename: 파일명
+            image: 이미 열린 원본 이미지 (RGB 변환 전, 없으면 image_bytes에서 로드)
         """
         result = {
             "has_c2pa": False,
@@ -70,7 +86,7 @@ class MetadataService:
         }
 
         # 1. EXIF 분석
-        exif_result = self._extract_exif(image_bytes)
+        exif_result = self._extract_exif(image_bytes, image)
         result["exif_data"] = exif_result.get("exif")
         result["software_used"] = exif_result.get("software")
         result["creation_date"] = exif_result.get("creation_date")
@@ -93,7 +109,7 @@ class MetadataService:
 
         return result
     
-    def _extract_exif(self, image_bytes: bytes) -> Dict[str, Any]:
+    def _extract_exif(self, image_bytes: bytes, image: Optional[Image.Image] = None) -> Dict[str, Any]:
         """EXIF 메타데이터 추출"""
         result = {
             "exif": {},
@@ -103,7 +119,7 @@ class MetadataService:
         }
         
         try:
-            img = Image.open(io.BytesIO(image_bytes))
+            img = image if image is not None else Image.open(io.BytesIO(image_bytes))
             
             # 기본 이미지 정보
             result["image_info"] = {
@@ -3,14 +3,24 @@ Pipeline Service
 3개 Layer를 통합하여 종합 판정 수행
 """
 
+import io
+import os
+import sys
 import uuid
 import time
-from datetime import datetime
-from typing import Dict, Any, Optional
+import asyncio
+from concurrent.futures import Executor
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Dict, Any, Final, List, NamedTuple, Optional, Tuple, Union
 
-from app.services.hash_service import HashService
+import numpy as np
+from PIL import Image
+
+from app.services.hash_service import HashService, content_digest
+from app.services.lru_cache import LRUCache
 from app.services.metadata_service import MetadataService
-from app.services.detection_service import DetectionService
+from app.services.detection_service import DetectionService, get_detector
 from app.models.schemas import (
     AnalysisResult, 
     HashResult, 
@@ -19,68 +29,182 @@ from app.models.schemas import (
     VerdictType
 )
 
+# 배치 분석에서 동시에 진행할 이미지별 분석 수 (Layer 2 / 종합 판정)
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "8"))
+
+# Layer 1 DinoV2 유사도 구간 (이상: AI, 중간: 불확실, 미만: Real)
+HASH_HIGH_SIMILARITY = 0.85
+HASH_MID_SIMILARITY = 0.70
+
+# EXIF 비정상 패턴 코드 → 판정 근거용 짧은 설명 (키는 intern하여 조회 시 포인터 비교)
+_INCONSISTENCY_MSGS: Final[Dict[str, str]] = {
+    sys.intern(code): msg for code, msg in {
+        "editing_software_without_camera": "편집 SW만 존재",
+        "perfect_square_ai_resolution": "AI 생성 해상도",
+        "unrealistic_aperture": "비현실적 촬영값",
+        "missing_datetime_original": "원본 시간 누락",
+    }.items()
+}
+
+
+class _LayerScores(NamedTuple):
+    """Layer 1+2 결과와 누적 점수 (Layer 3 반영 전)"""
+    hash_result: HashResult
+    metadata_result: MetadataResult
+    ai_score: float
+    real_score: float
+    reasons: List[str]
+    decisive: bool  # Layer 3 결과와 관계없이 Layer 1+2만으로 판정이 확정되는지
+
+
 class PipelineService:
     """3-Layer 분석 파이프라인 서비스"""
 
     def __init__(
         self,
+        hash_service: Optional[HashService] = None,
+        metadata_service: Optional[MetadataService] = None,
+        detection_service: Optional[DetectionService] = None,
         db_vectors_path: str = './data/ai_dinohashes.npy',
         metadata_path: str = './data/ai_metadata.csv',
-        similarity_threshold: float = 0.85
+        similarity_threshold: float = 0.85,
+        result_cache_size: int = 1024,
+        cpu_executor: Optional[Executor] = None
     ):
         """
         PipelineService 초기화
 
+        모델 재로딩을 막기 위해 앱 시작 시 생성한 서비스 인스턴스를 주입받습니다.
+        주입되지 않은 서비스만 새로 생성합니다.
+
         Args:
+            hash_service: 공유 HashService 인스턴스
+            metadata_service: 공유 MetadataService 인스턴스
+            detection_service: 공유 DetectionService 인스턴스
             db_vectors_path: AI 이미지 벡터 파일 경로
             metadata_path: AI 이미지 메타데이터 파일 경로
             similarity_threshold: DinoV2 유사도 임계값
+            result_cache_size: 콘텐츠 다이제스트별 분석 결과 캐시 크기
+            cpu_executor: 메타데이터 분석을 실행할 프로세스 풀 (없으면 기본 스레드 풀)
         """
-        self.hash_service = HashService(
+        self.hash_service = hash_service or HashService(
             db_vectors_path=db_vectors_path,
             metadata_path=metadata_path,
             threshold=similarity_threshold if similarity_threshold else 0.85
         )
-        self.metadata_service = MetadataService()
-        self.detection_service = DetectionService()
+        self.metadata_service = metadata_service or MetadataService()
+        self.detection_service = detection_service or get_detector()
+        self.cpu_executor = cpu_executor
+
+        # 같은 이미지를 다시 분석하면 캐시된 결과 반환
+        self._result_cache = LRUCache(maxsize=result_cache_size)
 
         # 판정 임계값
         self.CONFIDENCE_THRESHOLD = 0.7
         self.AI_DETECTION_WEIGHT = 0.3
         self.METADATA_WEIGHT = 0.4
         self.HASH_WEIGHT = 0.3
+        # 판정 시 매번 곱하지 않도록 세부 가중치를 미리 계산
+        self._w = SimpleNamespace(
+            meta=self.METADATA_WEIGHT,
+            sig=0.4 * self.METADATA_WEIGHT,
+            c2pa_ai=0.2 * self.METADATA_WEIGHT,
+            c2pa_real=0.15 * self.METADATA_WEIGHT,
+            exif_hi=0.35 * self.METADATA_WEIGHT,
+            exif_mid=0.15 * self.METADATA_WEIGHT,
+            exif_lo=0.25 * self.METADATA_WEIGHT,
+            det=self.AI_DETECTION_WEIGHT,
+        )
     
     async def analyze_image(
         self, 
         image_bytes: bytes, 
         filename: str,
+        skip_ai_detection: bool = False,
     ) -> AnalysisResult:
         """
         이미지 종합 분석 실행
+
+        Layer 1+2를 먼저 실행하고, Layer 3 결과와 관계없이 판정이 확정되면
+        Layer 3(AI 탐지 모델)는 요청하지 않습니다.
         
         Args:
             image_bytes: 이미지 바이너리 데이터
             filename: 파일명
+            skip_ai_detection: True면 Layer 3를 실행하지 않음
         """
-        start_time = time.time()
-        analysis_id = str(uuid.uuid4())
-        layers_executed = []
-        
+        start_time = time.perf_counter()
+
+        # 이전에 분석한 이미지면 캐시된 결과 반환
+        # (큰 이미지는 다이제스트가 스레드 풀을 기다리므로 이벤트 루프 밖에서 계산)
+        digest = await asyncio.to_thread(content_digest, image_bytes)
+        cached = self._get_cached_result(digest, filename, start_time)
+        if cached is not None:
+            return cached
+
+        # Layer 1과 Layer 2는 서로 독립적이므로 동시에 실행
+        # 프로세스 풀의 Layer 2는 원본 바이트만 필요하므로 디코딩 전에 먼저 시작
+        # (PIL 이미지를 pickle하면 픽셀 전체를 디코딩함)
+        metadata_task = None
+        if self.cpu_executor is not None:
+            metadata_task = asyncio.create_task(self._analyze_metadata(image_bytes, filename))
+
+        # 이미지 디코딩은 한 번만 수행하고 모든 Layer가 공유
+        try:
+            source_image, image = await asyncio.to_thread(self._decode_image, image_bytes)
+        except Exception:
+            if metadata_task is not None:
+                metadata_task.cancel()
+            raise
+
+        hash_task = asyncio.create_task(
+            self.hash_service.compute_hash_async(image_bytes, image, digest)
+        )
+        if metadata_task is None:
+            metadata_task = asyncio.create_task(
+                self._analyze_metadata(image_bytes, filename, source_image)
+            )
+
+        hash_data, metadata_data = await asyncio.gather(hash_task, metadata_task)
+        layers = self._score_layers(hash_data, metadata_data)
+
+        # ========== Layer 3: AI Detection ==========
+        # Layer 3가 어느 쪽으로 나와도 판정이 바뀌지 않으면 모델 추론을 요청하지 않음
+        detection_data = None
+        if not skip_ai_detection and not layers.decisive:
+            detection_data = await self.detection_service.detect(image_bytes, image)
+
+        return self._build_result(filename, digest, start_time, layers, detection_data)
+
+    async def _analyze_metadata(
+        self,
+        image_bytes: bytes,
+        filename: str,
+        source_image: Optional[Image.Image] = None
+    ) -> Dict[str, Any]:
+        """Layer 2 실행 (프로세스 풀이 있으면 원본 바이트로, 없으면 스레드에서 원본 이미지로)"""
+        if self.cpu_executor is not None:
+            return await asyncio.get_running_loop().run_in_executor(
+                self.cpu_executor, self.metadata_service.analyze, image_bytes, filename
+            )
+        return await asyncio.to_thread(
+            self.metadata_service.analyze, image_bytes, filename, source_image
+        )
+
+    def _score_layers(
+        self,
+        hash_data: Dict[str, Any],
+        metadata_data: Dict[str, Any],
+        hash_scores: Optional[Tuple[float, float]] = None
+    ) -> _LayerScores:
+        """Layer 1+2 결과를 스키마로 변환하고 조기 판정 여부 계산"""
         # ========== Layer 1: Hash Check ==========
-        layer1_start = time.time()
-        hash_data = self.hash_service.compute_hash(image_bytes)
-        
         hash_result = HashResult(
             is_ai=hash_data["is_ai"],
             similarity=hash_data["similarity"],
         )
-        layers_executed.append("hash_check")
-        layer1_time = (time.time() - layer1_start) * 1000
         
         # ========== Layer 2: Metadata Analysis ==========
-        layer2_start = time.time()
-        metadata_data = self.metadata_service.analyze(image_bytes, filename)
-        
         metadata_result = MetadataResult(
             has_c2pa=metadata_data.get("has_c2pa", False),
             c2pa_info=metadata_data.get("c2pa_info"),
@@ -91,103 +215,271 @@ class PipelineService:
             exif_authenticity_score=metadata_data.get("exif_authenticity_score", 0.0),
             exif_inconsistencies=metadata_data.get("exif_inconsistencies", [])
         )
-        layers_executed.append("metadata_analysis")
-        layer2_time = (time.time() - layer2_start) * 1000
         
-        # ========== Layer 3: AI Detection ==========
+        # ========== 조기 판정 (Layer 1+2) ==========
+        ai_score, real_score, reasons = self._score_hash_and_metadata(
+            hash_result, metadata_result, hash_scores
+        )
+        # Layer 3가 반대쪽에 최대 가중치를 더해도 판정이 바뀌지 않을 때만 확정
+        worst_if_real, _ = self._decide_verdict(ai_score, real_score + self.AI_DETECTION_WEIGHT)
+        worst_if_ai, _ = self._decide_verdict(ai_score + self.AI_DETECTION_WEIGHT, real_score)
+        decisive = (
+            worst_if_real == VerdictType.AI_GENERATED
+            or worst_if_ai == VerdictType.LIKELY_REAL
+        )
+        return _LayerScores(hash_result, metadata_result, ai_score, real_score, reasons, decisive)
+
+    def _build_result(
+        self,
+        filename: str,
+        digest: str,
+        start_time: float,
+        layers: _LayerScores,
+        detection_data: Optional[Dict[str, Any]]
+    ) -> AnalysisResult:
+        """Layer 3 결과를 반영하여 종합 판정 후 AnalysisResult 생성 및 캐시"""
+        layers_executed = ["hash_check", "metadata_analysis"]
         detection_result = None
-        layer3_time = 0
-        
-        layer3_start = time.time()
-        detection_data = await self.detection_service.detect(image_bytes)
-            
-        if "error" not in detection_data:
-            detection_result = DetectionResult(
-                model_name=detection_data["model_name"],
-                is_ai_generated=detection_data["is_ai_generated"],
-                confidence=detection_data["confidence"],
-                raw_scores=detection_data.get("raw_scores")
-                )
-        layers_executed.append("ai_detection")
-        layer3_time = (time.time() - layer3_start) * 1000
+
+        if detection_data is not None:
+            if "error" in detection_data:
+                # 탐지 실패는 판정에서 제외 (스킵과 동일하게 처리)하고 원인만 기록
+                print(f"⚠️ AI detection failed for {filename}: {detection_data['error']}")
+            else:
+                detection_result = DetectionResult(
+                    model_name=detection_data["model_name"],
+                    is_ai_generated=detection_data["is_ai_generated"],
+                    confidence=detection_data["confidence"],
+                    raw_scores=detection_data.get("raw_scores")
+                    )
+                layers_executed.append("ai_detection")
         
         # ========== 종합 판정 ==========
-        verdict, confidence, reasoning = self._compute_verdict(
-            hash_result=hash_result,
-            metadata_result=metadata_result,
-            detection_result=detection_result
+        reasons = layers.reasons
+        detection_ai, detection_real = self._score_detection(reasons, detection_result)
+        verdict, confidence = self._decide_verdict(
+            layers.ai_score + detection_ai, layers.real_score + detection_real
         )
         
-        total_time = (time.time() - start_time) * 1000
+        total_time = (time.perf_counter() - start_time) * 1000
         
         # 결과 생성
         result = AnalysisResult(
-            id=analysis_id,
+            id=str(uuid.uuid4()),
             filename=filename,
-            analyzed_at=datetime.utcnow(),
-            hash_result=hash_result,
-            metadata_result=metadata_result,
+            analyzed_at=datetime.now(timezone.utc),
+            hash_result=layers.hash_result,
+            metadata_result=layers.metadata_result,
             detection_result=detection_result,
             final_verdict=verdict,
-            confidence_score=confidence,
-            reasoning=reasoning,
+            confidence_score=round(confidence, 4),
+            reasoning=" | ".join(reasons),
             total_execution_time_ms=round(total_time, 2),
             layers_executed=layers_executed
         )
+
+        # AI 탐지까지 정상 완료됐거나 Layer 1+2로 판정이 확정된 결과만 캐시
+        if detection_result is not None or layers.decisive:
+            self._result_cache.put(digest, result)
         return result
+
+    def _get_cached_result(self, digest: str, filename: str, start_time: float) -> Optional[AnalysisResult]:
+        """캐시된 분석 결과를 새 ID/파일명/분석 시각으로 복사하여 반환 (없으면 None)"""
+        cached = self._result_cache.get(digest)
+        if cached is None:
+            return None
+
+        return cached.model_copy(update={
+            "id": str(uuid.uuid4()),
+            "filename": filename,
+            "analyzed_at": datetime.now(timezone.utc),
+            "total_execution_time_ms": round((time.perf_counter() - start_time) * 1000, 2),
+        })
+
+    @staticmethod
+    def _decode_image(image_bytes: bytes) -> Tuple[Image.Image, Image.Image]:
+        """
+        이미지 바이트를 한 번만 디코딩
+
+        Returns:
+            (원본 이미지, RGB 이미지) 튜플. 원본은 EXIF 분석에, RGB는 모델 추론에 사용
+        """
+        source_image = Image.open(io.BytesIO(image_bytes))
+        return source_image, source_image.convert("RGB")
+
+    async def analyze_images_batch(
+        self,
+        images_bytes: List[bytes],
+        filenames: List[str],
+        skip_ai_detection: bool = False,
+    ) -> List[Union[AnalysisResult, Dict[str, Any]]]:
+        """
+        여러 이미지 종합 분석 실행
+
+        Layer 1(DinoV2)은 배치 추론으로 한 번에 계산하고, Layer 2는 이미지별로
+        최대 BATCH_CONCURRENCY개씩 동시에 수행합니다. Layer 3(AI 탐지 모델)은
+        Layer 1+2만으로 판정이 확정되지 않은 이미지만 모아 배치 추론합니다.
+
+        Args:
+            images_bytes: 이미지 바이너리 데이터 리스트
+            filenames: 파일명 리스트
+            skip_ai_detection: True면 Layer 3를 실행하지 않음
+        """
+        results: List[Union[AnalysisResult, Dict[str, Any], None]] = [None] * len(images_bytes)
+        batch_start = time.perf_counter()
+        digests = await asyncio.gather(
+            *(asyncio.to_thread(content_digest, image_bytes) for image_bytes in images_bytes)
+        )
+
+        # 캐시된 이미지는 배치에서 제외
+        pending = []
+        for i, filename in enumerate(filenames):
+            cached = self._get_cached_result(digests[i], filename, batch_start)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append(i)
+
+        # 이미지 디코딩 (동시에 수행, 디코딩 실패한 이미지는 배치에서 제외)
+        decoded = await asyncio.gather(
+            *(asyncio.to_thread(self._decode_image, images_bytes[i]) for i in pending),
+            return_exceptions=True
+        )
+        source_images = []
+        images = []
+        positions = []
+        for i, decoded_image in zip(pending, decoded):
+            if isinstance(decoded_image, Exception):
+                results[i] = self._failed_result(filenames[i], decoded_image)
+                continue
+            source_image, image = decoded_image
+            source_images.append(source_image)
+            images.append(image)
+            positions.append(i)
+
+        # Layer 1 배치 추론과 이미지별 Layer 2를 동시에 실행 (프로세스 풀 과부하 방지를 위해 동시 수 제한)
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+        async def analyze_metadata_one(pos: int, source_image: Image.Image) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._analyze_metadata(images_bytes[pos], filenames[pos], source_image)
+
+        hash_batch, metadata_batch = await asyncio.gather(
+            asyncio.to_thread(
+                self._compute_hash_batch_isolated, images, [digests[i] for i in positions]
+            ),
+            asyncio.gather(
+                *(analyze_metadata_one(pos, src) for pos, src in zip(positions, source_images)),
+                return_exceptions=True
+            ),
+        )
+
+        # Layer 1 점수는 배치 전체를 한 번의 NumPy 연산으로 계산
+        hashed = [k for k, hash_data in enumerate(hash_batch) if not isinstance(hash_data, Exception)]
+        similarities = np.array([hash_batch[k]["similarity"] for k in hashed], dtype=np.float64)
+        hash_ai_scores, hash_real_scores = self._hash_scores(similarities, self.HASH_WEIGHT)
+        hash_scores = dict(zip(hashed, zip(hash_ai_scores.tolist(), hash_real_scores.tolist())))
+
+        scored = []
+        for k, (pos, hash_data, metadata_data) in enumerate(zip(positions, hash_batch, metadata_batch)):
+            try:
+                for layer_data in (hash_data, metadata_data):
+                    if isinstance(layer_data, Exception):
+                        raise layer_data
+                scored.append((k, self._score_layers(hash_data, metadata_data, hash_scores[k])))
+            except Exception as e:
+                results[pos] = self._failed_result(filenames[pos], e)
+
+        # Layer 3는 판정이 확정되지 않은 이미지만 배치 추론
+        undecided = [] if skip_ai_detection else [k for k, layers in scored if not layers.decisive]
+        detection_batch = await self.detection_service.detect_batch([images[k] for k in undecided])
+        detection_by_image = dict(zip(undecided, detection_batch))
+
+        batch_time_ms = (time.perf_counter() - batch_start) * 1000 / max(len(images), 1)
+        for k, layers in scored:
+            pos = positions[k]
+            try:
+                results[pos] = self._build_result(
+                    filenames[pos],
+                    digests[pos],
+                    time.perf_counter() - batch_time_ms / 1000,
+                    layers,
+                    detection_by_image.get(k)
+                )
+            except Exception as e:
+                results[pos] = self._failed_result(filenames[pos], e)
+        return results
+
+    def _compute_hash_batch_isolated(
+        self,
+        images: List[Image.Image],
+        digests: List[str]
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Layer 1 배치 추론 (배치가 실패하면 이미지별로 다시 실행)
+
+        한 이미지 때문에 배치 전체가 실패하지 않도록, 실패한 이미지만 예외로 반환합니다.
+        """
+        try:
+            return self.hash_service.compute_hash_batch(images, digests)
+        except Exception:
+            results = []
+            for image, digest in zip(images, digests):
+                try:
+                    results.append(self.hash_service.compute_hash_batch([image], [digest])[0])
+                except Exception as e:
+                    results.append(e)
+            return results
+
+    @staticmethod
+    def _failed_result(filename: str, error: Exception) -> Dict[str, Any]:
+        """배치 분석에서 실패한 이미지 결과"""
+        return {
+            "filename": filename,
+            "error": str(error),
+            "status": "failed"
+        }
     
-    def _compute_verdict(
+    def _score_hash_and_metadata(
         self,
         hash_result: HashResult,
         metadata_result: MetadataResult,
-        detection_result: Optional[DetectionResult]
-    ) -> tuple[VerdictType, float, str]:
+        hash_scores: Optional[Tuple[float, float]] = None
+    ) -> Tuple[float, float, List[str]]:
         """
-        종합 판정 계산
-
-        가중치 기반 판정:
-        - Hash: 30% (DinoV2 유사도, 점진적 계산)
-        - Metadata: 40% (EXIF 진위성 + C2PA/시그니처)
-        - AI Detection: 30% (HuggingFace 모델)
+        Layer 1+2 점수와 판정 근거 누적 (Layer 3 없이 조기 판정에도 사용)
 
-        Hash 점진적 계산:
+        Hash 점진적 계산 (DinoV2 유사도):
         - 85% 이상: AI 점수 (강도에 비례)
         - 70-85%: 불확실 영역 (양쪽 점수 분배)
         - 70% 미만: Real 점수
+
+        Metadata: EXIF 진위성 + C2PA/시그니처/EXIF 비정상 패턴
+
+        Args:
+            hash_scores: 미리 계산된 Layer 1 (AI, Real) 점수 (없으면 유사도로 계산)
         """
-        scores = {
-            "ai": 0.0,
-            "real": 0.0
-        }
-        reasons = []
-        
+        w = self._w
+
         # 1. Hash 기반 판정 (DinoV2 벡터 유사도) - 점진적 점수 계산
         similarity = hash_result.similarity
+        if hash_scores is None:
+            hash_scores = self._hash_score(similarity, self.HASH_WEIGHT)
+
+        ai_score, real_score = hash_scores
+        reasons = []
 
-        if similarity >= 0.85:
-            # 85% 이상: 확실한 AI 이미지 (임계값 이상)
-            ai_score = self.HASH_WEIGHT * min((similarity - 0.85) / 0.15 + 0.5, 1.0)
-            scores["ai"] += ai_score
+        if similarity >= HASH_HIGH_SIMILARITY:
             reasons.append(
                 f"⚠️ AI 이미지 DB와 {'매칭됨' if hash_result.is_ai else '높은 유사도'} "
                 f"(유사도: {similarity:.1%})"
             )
-        elif similarity >= 0.70:
-            # 70-85%: 불확실한 영역 (유사하지만 확신 부족)
-            # 유사도에 비례하여 점수 분배
-            uncertainty = (0.85 - similarity) / 0.15
-            ai_portion = self.HASH_WEIGHT * 0.5 * (1 - uncertainty)
-            real_portion = self.HASH_WEIGHT * 0.5 * uncertainty
-            scores["ai"] += ai_portion
-            scores["real"] += real_portion
+        elif similarity >= HASH_MID_SIMILARITY:
             reasons.append(
                 f"⚠️ AI 이미지 DB와 중간 유사도 "
                 f"(유사도: {similarity:.1%}, 불확실)"
             )
         else:
-            # 70% 미만: 실제 이미지 가능성
-            real_score = self.HASH_WEIGHT * 0.5
-            scores["real"] += real_score
             reasons.append(
                 f"✓ AI 이미지 DB와 낮은 유사도 "
                 f"(최대 유사도: {similarity:.1%})"
@@ -196,19 +488,19 @@ class PipelineService:
         # 2. Metadata 기반 판정
         # 2-1. AI 도구 시그니처 (강력한 AI 증거)
         if metadata_result.ai_tool_signatures:
+            ai_score += w.sig
             tools = ", ".join(metadata_result.ai_tool_signatures)
-            scores["ai"] += self.METADATA_WEIGHT * 0.4
             reasons.append(f"🔍 AI 도구 시그니처 발견: {tools}")
 
         # 2-2. C2PA 분석
         if metadata_result.has_c2pa:
             c2pa_info = metadata_result.c2pa_info or {}
             if c2pa_info.get("ai_related_assertions"):
-                scores["ai"] += self.METADATA_WEIGHT * 0.2
+                ai_score += w.c2pa_ai
                 reasons.append("🤖 C2PA에 AI 생성 관련 정보 포함")
             else:
                 # C2PA가 있지만 AI 관련 정보가 없으면 실제 이미지 가능성
-                scores["real"] += self.METADATA_WEIGHT * 0.15
+                real_score += w.c2pa_real
                 reasons.append("📜 C2PA Content Credentials 존재 (AI 관련 정보 없음)")
 
         # 2-3. EXIF 진위성 점수 활용 (새로 추가된 핵심 기능)
@@ -216,54 +508,101 @@ class PipelineService:
 
         if exif_score >= 0.7:
             # 높은 EXIF 진위성 = 실제 카메라로 촬영
-            scores["real"] += self.METADATA_WEIGHT * 0.35 * exif_score
+            real_score += w.exif_hi * exif_score
             reasons.append(f"📷 EXIF 진위성 높음 (점수: {exif_score:.2f}) - 실제 카메라 촬영 가능성")
         elif exif_score >= 0.3:
             # 중간 수준
-            scores["real"] += self.METADATA_WEIGHT * 0.15 * exif_score
+            real_score += w.exif_mid * exif_score
             reasons.append(f"📷 EXIF 데이터 존재 (진위성: {exif_score:.2f})")
         else:
             # 낮은 EXIF 진위성 = AI 생성 의심
-            scores["ai"] += self.METADATA_WEIGHT * 0.25
+            ai_score += w.exif_lo
             reasons.append(f"⚠️ EXIF 진위성 낮음 (점수: {exif_score:.2f}) - AI 생성 의심")
 
         # 2-4. EXIF 비정상 패턴 탐지
         if metadata_result.exif_inconsistencies:
             inconsistency_weight = min(len(metadata_result.exif_inconsistencies) * 0.05, 0.15)
-            scores["ai"] += self.METADATA_WEIGHT * inconsistency_weight
-            inconsistency_msgs = {
-                "editing_software_without_camera": "편집 SW만 존재",
-                "perfect_square_ai_resolution": "AI 생성 해상도",
-                "unrealistic_aperture": "비현실적 촬영값",
-                "missing_datetime_original": "원본 시간 누락"
-            }
-            detected = [inconsistency_msgs.get(inc, inc) for inc in metadata_result.exif_inconsistencies]
+            ai_score += w.meta * inconsistency_weight
+            detected = [_INCONSISTENCY_MSGS.get(inc, inc) for inc in metadata_result.exif_inconsistencies]
             reasons.append(f"⚠️ EXIF 비정상 패턴: {', '.join(detected)}")
         
+        return ai_score, real_score, reasons
+
+    @staticmethod
+    def _hash_scores(sim: np.ndarray, W: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        DinoV2 유사도 배열의 Layer 1 (AI, Real) 점수를 한 번에 계산
+
+        - 85% 이상: AI 점수 (강도에 비례, 최대 W)
+        - 70-85%: 불확실 영역 (유사도에 비례하여 양쪽 점수 분배)
+        - 70% 미만: Real 점수 W * 0.5
+        """
+        band = HASH_HIGH_SIMILARITY - HASH_MID_SIMILARITY
+        uncertainty = (HASH_HIGH_SIMILARITY - sim) / band
+        high = sim >= HASH_HIGH_SIMILARITY
+        mid = (sim >= HASH_MID_SIMILARITY) & ~high
+        ai = np.where(
+            high, W * np.minimum((sim - HASH_HIGH_SIMILARITY) / band + 0.5, 1.0),
+            np.where(mid, W * 0.5 * (1 - uncertainty), 0.0)
+        )
+        real = np.where(high, 0.0, np.where(mid, W * 0.5 * uncertainty, W * 0.5))
+        return ai, real
+
+    @staticmethod
+    def _hash_score(similarity: float, W: float) -> Tuple[float, float]:
+        """
+        단일 유사도의 Layer 1 (AI, Real) 점수 (_hash_scores와 같은 계산의 float 버전)
+
+        단일 요청에서는 0차원 NumPy 연산보다 float 분기가 훨씬 빠르므로 따로 둡니다.
+        """
+        band = HASH_HIGH_SIMILARITY - HASH_MID_SIMILARITY
+        if similarity >= HASH_HIGH_SIMILARITY:
+            return W * min((similarity - HASH_HIGH_SIMILARITY) / band + 0.5, 1.0), 0.0
+        if similarity >= HASH_MID_SIMILARITY:
+            uncertainty = (HASH_HIGH_SIMILARITY - similarity) / band
+            return W * 0.5 * (1 - uncertainty), W * 0.5 * uncertainty
+        return 0.0, W * 0.5
+
+    def _score_detection(
+        self,
+        reasons: List[str],
+        detection_result: Optional[DetectionResult]
+    ) -> Tuple[float, float]:
+        """Layer 3 판정 근거를 추가하고 더할 (AI, Real) 점수 반환"""
         # 3. AI Detection 기반 판정
         if detection_result:
             if detection_result.is_ai_generated:
-                scores["ai"] += self.AI_DETECTION_WEIGHT * detection_result.confidence
                 reasons.append(
                     f"🤖 AI 탐지 모델 판정: AI 생성 "
                     f"(확신도: {detection_result.confidence:.1%})"
                 )
-            else:
-                scores["real"] += self.AI_DETECTION_WEIGHT * detection_result.confidence
-                reasons.append(
-                    f"✅ AI 탐지 모델 판정: 실제 이미지 가능성 "
-                    f"(확신도: {detection_result.confidence:.1%})"
-                )
-        else:
-            reasons.append("⏭️ AI 탐지 스킵됨")
-        
-        # 최종 판정
-        total_score = scores["ai"] + scores["real"]
+                return self._w.det * detection_result.confidence, 0.0
+            reasons.append(
+                f"✅ AI 탐지 모델 판정: 실제 이미지 가능성 "
+                f"(확신도: {detection_result.confidence:.1%})"
+            )
+            return 0.0, self._w.det * detection_result.confidence
+        reasons.append("⏭️ AI 탐지 스킵됨")
+        return 0.0, 0.0
+
+    def _decide_verdict(self, ai_score: float, real_score: float) -> Tuple[VerdictType, float]:
+        """
+        누적 점수로부터 판정과 확신도 계산
+
+        가중치 기반 판정:
+        - Hash: 30% (DinoV2 유사도, 점진적 계산)
+        - Metadata: 40% (EXIF 진위성 + C2PA/시그니처)
+        - AI Detection: 30% (HuggingFace 모델)
+
+        AI 점수 비율이 CONFIDENCE_THRESHOLD 이상이면 AI 생성,
+        (1 - CONFIDENCE_THRESHOLD) 이하이면 실제 이미지, 그 사이는 불확실로 판정합니다.
+        """
+        total_score = ai_score + real_score
         if total_score == 0:
             verdict = VerdictType.UNCERTAIN
             confidence = 0.5
         else:
-            ai_ratio = scores["ai"] / total_score if total_score > 0 else 0.5
+            ai_ratio = ai_score / total_score if total_score > 0 else 0.5
             
             if ai_ratio >= self.CONFIDENCE_THRESHOLD:
                 verdict = VerdictType.AI_GENERATED
@@ -275,8 +614,6 @@ class PipelineService:
                 verdict = VerdictType.UNCERTAIN
                 confidence = 0.5 + abs(ai_ratio - 0.5)
         
-        reasoning = " | ".join(reasons)
-        
-        return verdict, round(confidence, 4), reasoning
+        return verdict, confidence
     
 
@@ -3,15 +3,24 @@ Streamlit UI - AI Image Filter Pipeline
 """
 
 import streamlit as st
-import requests
+import httpx
 import pandas as pd
 from PIL import Image
 import io
 import time
 from datetime import datetime
 
+# orjson은 선택적 import (설치 안 되어 있으면 표준 json 파서 사용)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # ============ 설정 ============
 API_URL = "http://localhost:8000/api/v1"  # FastAPI 서버 주소
+BATCH_TIMEOUT = 300  # 배치 분석 요청 타임아웃 (초)
+BATCH_CHUNK_SIZE = 50  # /analyze/batch 요청당 최대 파일 수 (서버 제한과 동일)
 
 # 페이지 설정
 st.set_page_config(
@@ -22,7 +31,8 @@ st.set_page_config(
 )
 
 # ============ CSS 스타일 ============
-st.markdown("""
+# 정적 문자열은 모듈 상수로 한 번만 만들고 그대로 사용 (상수를 st.cache_data로 감싸도 얻는 것이 없음)
+CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -62,19 +72,88 @@ st.markdown("""
         text-align: center;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+HEADER_HTML = (
+    '<p class="main-header">🔍 AI Image Filter Pipeline</p>'
+    '<p class="sub-header">ML 학습 데이터셋에서 AI 생성 이미지를 필터링하는 3-Layer 검증 시스템</p>'
+)
+
+
+st.markdown(CSS, unsafe_allow_html=True)
+
+
+@st.cache_resource
+def get_client(api_url: str) -> httpx.Client:
+    """단일 분석용 HTTP/2 클라이언트 (rerun 간 커넥션 재사용)"""
+    return httpx.Client(
+        http2=True,
+        base_url=api_url,
+        timeout=60,
+        headers={"Accept": "application/json"}
+    )
+
+
+def parse_json(response: httpx.Response):
+    """응답 JSON 파싱 (orjson이 있으면 사용)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def analyze_batch(client: httpx.Client, files: list, params: dict) -> httpx.Response:
+    """이미지 묶음 하나를 /analyze/batch 요청으로 전송 (최대 BATCH_CHUNK_SIZE개)"""
+    for file in files:
+        file.seek(0)
+    return client.post(
+        "/analyze/batch",
+        files=[("files", (file.name, file, file.type)) for file in files],
+        params=params,
+        timeout=BATCH_TIMEOUT
+    )
+
+
+def result_row(result: dict) -> dict:
+    """배치 분석 결과 하나를 결과 테이블 행으로 변환"""
+    if "error" in result:
+        return {
+            "파일명": result.get("filename", "-"),
+            "판정": "error",
+            "확신도": "-",
+            "DinoV2 유사도": "-",
+            "EXIF 진위성": "-",
+            "AI 시그니처": str(result["error"])[:30],
+            "EXIF 비정상": "-"
+        }
+    
+    metadata = result.get("metadata_result", {})
+    hash_res = result.get("hash_result", {})
+    return {
+        "파일명": result.get("filename", "-"),
+        "판정": result.get("final_verdict", "unknown"),
+        "확신도": f"{result.get('confidence_score', 0):.1%}",
+        "DinoV2 유사도": f"{hash_res.get('similarity', 0):.1%}",
+        "EXIF 진위성": f"{metadata.get('exif_authenticity_score', 0):.2f}",
+        "AI 시그니처": ", ".join(metadata.get("ai_tool_signatures", [])) or "-",
+        "EXIF 비정상": len(metadata.get("exif_inconsistencies", []))
+    }
 
 
 def main():
     # 헤더
-    st.markdown('<p class="main-header">🔍 AI Image Filter Pipeline</p>', unsafe_allow_html=True)
-    st.markdown('<p class="sub-header">ML 학습 데이터셋에서 AI 생성 이미지를 필터링하는 3-Layer 검증 시스템</p>', unsafe_allow_html=True)
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
     
     # 사이드바
     with st.sidebar:
         st.header("⚙️ 설정")
         
         api_url = st.text_input("API URL", value=API_URL)
+        skip_ai_detection = st.checkbox(
+            "AI 탐지(Layer 3) 건너뛰기",
+            value=False,
+            help="Layer 1+2 결과만으로 판정합니다. 판정이 확실한 이미지는 체크하지 않아도 자동으로 생략됩니다."
+        )
+        params = {"skip_ai_detection": skip_ai_detection}
         
         st.divider()
         
@@ -126,23 +205,19 @@ def main():
                 if st.button("🚀 분석 시작", type="primary", key="analyze_single"):
                     with st.spinner("분석 중..."):
                         try:
-                            # API 호출
+                            # API 호출 (getvalue() 복사 없이 파일 객체를 청크 단위로 전송)
                             uploaded_file.seek(0)
-                            files = {"file": (uploaded_file.name, uploaded_file.getvalue(), uploaded_file.type)}
+                            files = {"file": (uploaded_file.name, uploaded_file, uploaded_file.type)}
                             
-                            response = requests.post(
-                                f"{api_url}/analyze",
-                                files=files,
-                                timeout=60
-                            )
+                            response = get_client(api_url).post("/analyze", files=files, params=params)
                             
                             if response.status_code == 200:
-                                result = response.json()
+                                result = parse_json(response)
                                 display_result(result)
                             else:
                                 st.error(f"분석 실패: {response.text}")
                                 
-                        except requests.exceptions.ConnectionError:
+                        except httpx.ConnectError:
                             st.error("⚠️ API 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.")
                             st.info("로컬 테스트: `uvicorn app.main:app --reload`")
                         except Exception as e:
@@ -151,7 +226,7 @@ def main():
     # ============ 탭 2: 배치 분석 ============
     with tab2:
         st.header("배치 이미지 분석")
-        st.info("최대 50개 이미지를 한 번에 분석할 수 있습니다.")
+        st.info(f"{BATCH_CHUNK_SIZE}개씩 나눠 서버에 배치 요청합니다.")
         
         uploaded_files = st.file_uploader(
             "여러 이미지를 업로드하세요",
@@ -167,80 +242,62 @@ def main():
                 progress_bar = st.progress(0)
                 status_text = st.empty()
                 results = []
+                total = len(uploaded_files)
                 
-                for i, file in enumerate(uploaded_files):
-                    status_text.text(f"분석 중: {file.name} ({i+1}/{len(uploaded_files)})")
+                # 서버 제한(50개)에 맞춰 청크 단위로 나눠 전송 (청크마다 서버에서 배치 추론)
+                for start in range(0, total, BATCH_CHUNK_SIZE):
+                    chunk = uploaded_files[start:start + BATCH_CHUNK_SIZE]
+                    status_text.text(f"분석 중: {start + 1}-{start + len(chunk)}/{total}")
                     
                     try:
-                        file.seek(0)
-                        files = {"file": (file.name, file.getvalue(), file.type)}
-                        
-                        response = requests.post(
-                            f"{api_url}/analyze",
-                            files=files,
-                            timeout=60
-                        )
-                        
-                        if response.status_code == 200:
-                            result = response.json()
-                            metadata = result.get("metadata_result", {})
-                            hash_res = result.get("hash_result", {})
-                            results.append({
-                                "파일명": file.name,
-                                "판정": result.get("final_verdict", "unknown"),
-                                "확신도": f"{result.get('confidence_score', 0):.1%}",
-                                "DinoV2 유사도": f"{hash_res.get('similarity', 0):.1%}",
-                                "EXIF 진위성": f"{metadata.get('exif_authenticity_score', 0):.2f}",
-                                "AI 시그니처": ", ".join(metadata.get("ai_tool_signatures", [])) or "-",
-                                "EXIF 비정상": len(metadata.get("exif_inconsistencies", []))
-                            })
-                        else:
-                            results.append({
-                                "파일명": file.name,
-                                "판정": "error",
-                                "확신도": "-",
-                                "DinoV2 유사도": "-",
-                                "EXIF 진위성": "-",
-                                "AI 시그니처": "-",
-                                "EXIF 비정상": "-"
-                            })
+                        response = analyze_batch(get_client(api_url), chunk, params)
+                    except httpx.ConnectError:
+                        st.error("⚠️ API 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.")
+                        st.info("로컬 테스트: `uvicorn app.main:app --reload`")
+                        break
                     except Exception as e:
-                        results.append({
-                            "파일명": file.name,
-                            "판정": "error",
-                            "확신도": "-",
-                            "DinoV2 유사도": "-",
-                            "EXIF 진위성": "-",
-                            "AI 시그니처": str(e)[:30],
-                            "EXIF 비정상": "-"
-                        })
+                        response = None
+                        error = str(e)
                     
-                    progress_bar.progress((i + 1) / len(uploaded_files))
-                
-                status_text.text("✅ 분석 완료!")
-                
-                # 결과 테이블
-                df = pd.DataFrame(results)
-                st.dataframe(df, use_container_width=True)
-                
-                # 통계
-                col1, col2, col3 = st.columns(3)
-                ai_count = sum(1 for r in results if r["판정"] == "ai_generated")
-                real_count = sum(1 for r in results if r["판정"] == "likely_real")
-                uncertain_count = sum(1 for r in results if r["판정"] == "uncertain")
+                    if response is not None and response.status_code == 200:
+                        results.extend(result_row(r) for r in parse_json(response).get("results", []))
+                    else:
+                        # 실패한 청크는 파일별 error 행으로 기록하고 다음 청크 계속 진행
+                        if response is not None:
+                            error = f"HTTP {response.status_code}"
+                        results.extend(
+                            result_row({"filename": file.name, "error": error}) for file in chunk
+                        )
+                    
+                    progress_bar.progress((start + len(chunk)) / total)
                 
-                col1.metric("🤖 AI 생성", ai_count)
-                col2.metric("✅ 실제 이미지", real_count)
-                col3.metric("❓ 불확실", uncertain_count)
+                status_text.empty()
                 
-                # CSV 다운로드
-                csv = df.to_csv(index=False).encode('utf-8-sig')
-                st.download_button(
-                    "📥 결과 CSV 다운로드",
-                    csv,
-                    f"ai_filter_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    "text/csv"
-                )
+                if results:
+                    st.success("✅ 분석 완료!")
+                    
+                    # 결과 테이블
+                    df = pd.DataFrame(results)
+                    st.dataframe(df, use_container_width=True)
+                    
+                    # 통계
+                    col1, col2, col3 = st.columns(3)
+                    ai_count = sum(1 for r in results if r["판정"] == "ai_generated")
+                    real_count = sum(1 for r in results if r["판정"] == "likely_real")
+                    uncertain_count = sum(1 for r in results if r["판정"] == "uncertain")
+                    
+                    col1.metric("🤖 AI 생성", ai_count)
+                    col2.metric("✅ 실제 이미지", real_count)
+                    col3.metric("❓ 불확실", uncertain_count)
+                    
+                    # CSV 다운로드 (results는 버튼을 누른 실행에만 존재하므로 분석당 한 번만 인코딩)
+                    csv = df.to_csv(index=False).encode('utf-8-sig')
+                    st.download_button(
+                        "📥 결과 CSV 다운로드",
+                        csv,
+                        f"ai_filter_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                        "text/csv"
+                    )
     
 
 
@@ -381,8 +438,7 @@ def display_result(result: dict):
             
             if detection.get("raw_scores"):
                 st.write("**Raw Scores:**")
-                for label, score in detection["raw_scores"].items():
-                    st.progress(score, text=f"{label}: {score:.1%}")
+                st.bar_chart(pd.Series(detection["raw_scores"], name="score"))
         else:
             st.info("AI 탐지가 진행되지 않았습니다.")
     